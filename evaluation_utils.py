@@ -1,12 +1,24 @@
 import json
+import logging
 import math
 import os
+import queue
 import re
+import threading
 import time
 from typing import Any
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib encoder writes equivalent JSON.
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_ensured_dirs: set[str] = set()
+
 
 def _get_json_with_retry(
     url: str,
@@ -30,6 +42,132 @@ def _get_json_with_retry(
     raise RuntimeError(f"Request failed for {url}: {last_err}")
 
 
+def ensure_dir(path: str) -> None:
+    """Create ``path`` (and parents) once per process; later calls are a set lookup."""
+    if path in _ensured_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
+def encode_json(data: Any) -> bytes:
+    """Serialize ``data`` as 2-space indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def write_json(path: str, data: Any) -> None:
+    with open(path, "wb") as f:
+        f.write(encode_json(data))
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write ``data`` to ``path`` via a unique temp file and ``os.replace``.
+
+    Readers, including other processes, see either the old file or the new one, never
+    a partial write.
+    """
+    # Per-process name so concurrent harnesses never share it; plain open() keeps the
+    # umask-derived permissions that mkstemp's 0600 would not.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(encode_json(data))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_json_if_changed(path: str, data: Any) -> bool:
+    """Write ``data`` unless ``path`` already holds the same bytes; return whether it wrote."""
+    encoded = encode_json(data)
+    try:
+        with open(path, "rb") as f:
+            if f.read() == encoded:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, "wb") as f:
+        f.write(encoded)
+    return True
+
+
+class BackgroundWriter:
+    """Writes pre-encoded files from a single daemon thread.
+
+    Callers encode on their own thread and hand over bytes with ``put``, so the next
+    model call is not held up by disk IO. ``close`` blocks until every queued file
+    has been written.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[tuple[str, bytes] | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, name="evaluation-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, path: str, data: bytes) -> None:
+        self._queue.put((path, data))
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _drain(self) -> None:
+        while (item := self._queue.get()) is not None:
+            path, data = item
+            try:
+                with open(path, "wb") as f:
+                    f.write(data)
+            except OSError:
+                logger.exception("Failed to write %s", path)
+
+
+def append_run_manifest_event(run_dir: str, event: dict[str, Any]) -> None:
+    """Record one framework run in ``manifest.jsonl``; see ``finalize_manifest``."""
+    with open(os.path.join(run_dir, "manifest.jsonl"), "a") as f:
+        f.write(json.dumps(event) + "\n")
+
+
+def finalize_manifest(run_dir: str) -> None:
+    """Fold ``manifest.jsonl`` events into ``manifest.json``, one entry per framework (latest wins)."""
+    manifest_path = os.path.join(run_dir, "manifest.json")
+    manifest: dict = {}
+    try:
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        pass
+    except json.JSONDecodeError:
+        # manifest.jsonl is the source of truth; rebuild from it.
+        logger.warning("Ignoring unreadable %s; rebuilding it from manifest.jsonl", manifest_path)
+
+    if not manifest:
+        manifest = {
+            "run_group": os.path.basename(run_dir),
+            "framework_runs": {},
+        }
+
+    events_path = os.path.join(run_dir, "manifest.jsonl")
+    if os.path.exists(events_path):
+        with open(events_path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # Another harness may be mid-append; its own finalize will fold the line.
+                    logger.warning("Skipping incomplete event in %s", events_path)
+                    continue
+                manifest["framework_runs"][event.pop("framework")] = event
+
+    # Scratch and strands runs may finalize the same run group concurrently.
+    write_json_atomic(manifest_path, manifest)
+
+
 def _canonical_error_entry(prompt_type: str, query: str | None, err: Exception) -> dict[str, Any]:
     return {
         "type": prompt_type,
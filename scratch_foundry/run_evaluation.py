@@ -1,9 +1,10 @@
 import argparse
 import os
-import json
+import queue
 import re
 import sys
 import logging
+import threading
 import time
 from datetime import datetime, timezone
 
@@ -17,13 +18,24 @@ from evaluation_utils import (
     classify_provenance,
     build_canonical_snapshot,
     extract_data_hints_scratch,
+    BackgroundWriter,
+    encode_json,
+    write_json_if_changed,
+    append_run_manifest_event,
+    finalize_manifest,
+    ensure_dir,
 )
 
 logger = logging.getLogger(__name__)
 
+_SANITIZE_RE = re.compile(r"[^-\w.]")
+
+# Threads that validate and encode finished prompts while the next one runs.
+RESULT_CONSUMERS = 2
+
 
 def setup_logging(log_dir: str) -> logging.Logger:
-    os.makedirs(log_dir, exist_ok=True)
+    ensure_dir(log_dir)
     log_path = os.path.join(log_dir, "scratch_evaluation.log")
 
     logging.basicConfig(
@@ -35,68 +47,110 @@ def setup_logging(log_dir: str) -> logging.Logger:
 
 def sanitize_filename(text: str) -> str:
     """Sanitizes a string for use as a filename."""
-    s = str(text).strip().replace(' ', '_')
-    s = re.sub(r'(?u)[^-\w.]', '', s)
-    return s
-
-def update_run_manifest(
-    run_dir: str,
-    framework: str,
-    models: list[str],
-    prompt_file: str,
-    prompt_version: str,
-    started_at_utc: str,
-    started_at_human: str,
+    if not isinstance(text, str):
+        text = str(text)
+    return _SANITIZE_RE.sub('', text.strip().replace(' ', '_'))
+
+
+def _consume_results(jobs: queue.Queue, canonical_snapshot: dict, writer: BackgroundWriter) -> None:
+    while (job := jobs.get()) is not None:
+        try:
+            _save_result(canonical_snapshot=canonical_snapshot, writer=writer, **job)
+        except Exception as e:
+            logger.exception(
+                "    Error saving prompt '%s' for model %s: %s",
+                job["prompt_obj"]["text"],
+                job["model_name"],
+                e,
+            )
+
+
+def _save_result(
+    model_name: str,
+    prompt_obj: dict,
+    response: str,
+    messages: list,
+    eval_time_unix: int,
+    prefix: str,
+    run_meta: dict,
+    sidecar_base: dict,
+    canonical_snapshot: dict,
+    writer: BackgroundWriter,
 ) -> None:
-    manifest_path = os.path.join(run_dir, "manifest.json")
-    manifest: dict = {}
-    if os.path.exists(manifest_path):
-        with open(manifest_path, "r") as f:
-            manifest = json.load(f)
-
-    if not manifest:
-        manifest = {
-            "run_group": os.path.basename(run_dir),
-            "framework_runs": {},
-        }
-
-    manifest["framework_runs"][framework] = {
-        "started_at_utc": started_at_utc,
-        "started_at_human": started_at_human,
-        "models": models,
-        "prompt_file": prompt_file,
-        "prompt_version": prompt_version,
+    prompt_name = prompt_obj["name"]
+
+    # Save the conversation log
+    log_path = prefix + ".json"
+    messages_as_dict = []
+    for message in messages:
+        if hasattr(message, 'dict'):
+            messages_as_dict.append(message.dict())
+        else:
+            messages_as_dict.append(message)
+    payload = {
+        "run": run_meta,
+        "model": model_name,
+        "prompt_name": prompt_name,
+        "prompt_version": sidecar_base["prompt_version"],
+        "prompt_text": prompt_obj["text"],
+        "final_text": response,
+        "messages": messages_as_dict,
     }
+    writer.put(log_path, encode_json(payload))
+
+    # Validation + provenance (sidecar)
+    tool_used, tool_names = detect_tool_use_scratch(messages_as_dict)
+    validation = validate_result(prompt_obj, response, canonical_snapshot, eval_time_unix=eval_time_unix)
+    provenance = classify_provenance(tool_used, validation)
+    data_hints = extract_data_hints_scratch(messages_as_dict)
+
+    canonical = canonical_snapshot["prompts"].get(prompt_name, {})
+    validation_path = prefix + "_validation.json"
+    sidecar = sidecar_base | {
+        "prompt_name": prompt_name,
+        "canonical": canonical,
+        "messages_file": os.path.basename(log_path),
+        "tool_used": tool_used,
+        "tool_names": tool_names,
+        "provenance": provenance,
+        "eval_time_unix": eval_time_unix,
+        "data_hints": data_hints,
+        "validation": validation,
+    }
+    writer.put(validation_path, encode_json(sidecar))
 
-    with open(manifest_path, "w") as f:
-        json.dump(manifest, f, indent=2)
-
+    logger.info("    Results queued for %s", log_path)
+    logger.info("    Validation queued for %s", validation_path)
 
 def run_evaluation(models: list[str], prompt_file: str, run_group: str | None):
     """
     Runs the evaluation suite against a list of models.
     """
+    started_utc = datetime.now(timezone.utc)
+    started_local = started_utc.astimezone()
+
     repo_root = os.path.dirname(os.path.dirname(__file__))
-    run_group_id = run_group or datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_group_id = run_group or started_local.strftime("%Y%m%d_%H%M%S")
     run_dir = os.path.join(repo_root, "evaluation_results", "runs", run_group_id)
-    os.makedirs(run_dir, exist_ok=True)
+    ensure_dir(run_dir)
 
-    started_dt = datetime.now().astimezone()
-    run_started_human = started_dt.strftime("%Y-%m-%d %H:%M:%S %Z")
-    run_started_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    run_started_human = started_local.strftime("%Y-%m-%d %H:%M:%S %Z")
+    run_started_utc = started_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
 
     prompt_data = load_prompts(prompt_file)
     prompts = prompt_data["prompts"]
     prompt_version = prompt_data.get("version", "unknown")
 
-    update_run_manifest(
-        run_dir=run_dir,
-        framework="scratch",
-        models=models,
-        prompt_file=prompt_file,
-        prompt_version=prompt_version,
-        started_at_utc=run_started_utc,
-        started_at_human=run_started_human,
+    append_run_manifest_event(
+        run_dir,
+        {
+            "framework": "scratch",
+            "started_at_utc": run_started_utc,
+            "started_at_human": run_started_human,
+            "models": models,
+            "prompt_file": prompt_file,
+            "prompt_version": prompt_version,
+        },
     )
 
     logger.info("Run group: %s", run_group_id)
@@ -104,100 +158,86 @@ def run_evaluation(models: list[str], prompt_file: str, run_group: str | None):
 
     canonical_snapshot = build_canonical_snapshot(prompt_data)
     canonical_dir = os.path.join(run_dir, "canonical")
-    os.makedirs(canonical_dir, exist_ok=True)
+    ensure_dir(canonical_dir)
     canonical_path = os.path.join(canonical_dir, f"canonical_{prompt_version}.json")
-    with open(canonical_path, "w") as f:
-        json.dump(canonical_snapshot, f, indent=2)
-    logger.info("Canonical snapshot saved to %s", canonical_path)
+    if write_json_if_changed(canonical_path, canonical_snapshot):
+        logger.info("Canonical snapshot saved to %s", canonical_path)
+    else:
+        logger.info("Canonical snapshot unchanged at %s", canonical_path)
     
     results_root = os.path.join(run_dir, "scratch")
-    if not os.path.exists(results_root):
-        os.makedirs(results_root)
-
-    for model_name in models:
-        sanitized_model_name = sanitize_filename(model_name)
-        model_results_dir = os.path.join(results_root, sanitized_model_name)
-        if not os.path.exists(model_results_dir):
-            os.makedirs(model_results_dir)
-
-        logger.info("--- Running evaluation for model: %s ---", model_name)
-        for prompt_obj in prompts:
-            prompt_name = prompt_obj["name"]
-            prompt_text = prompt_obj["text"]
-            
-            logger.info("  - Running prompt: '%s'", prompt_text)
-            try:
-                # Re-create agent for each prompt to ensure a clean state
-                agent = create_agent(model_name)
-                response = agent.run(prompt_text)
-                
-                # Save the conversation log
-                log_path = os.path.join(model_results_dir, f"{prompt_name}.json")
-                with open(log_path, "w") as f:
-                    messages_as_dict = []
-                    for message in agent.messages:
-                        if hasattr(message, 'dict'):
-                            messages_as_dict.append(message.dict())
-                        else:
-                            messages_as_dict.append(message)
-                    payload = {
-                        "run": {
-                            "run_group": run_group_id,
-                            "framework": "scratch",
-                            "started_at_human": run_started_human,
-                            "started_at_utc": run_started_utc,
-                        },
-                        "model": model_name,
-                        "prompt_name": prompt_name,
-                        "prompt_version": prompt_version,
-                        "prompt_text": prompt_text,
-                        "final_text": response,
-                        "messages": messages_as_dict,
-                    }
-                    json.dump(payload, f, indent=2)
-
-                # Validation + provenance (sidecar)
-                tool_used, tool_names = detect_tool_use_scratch(messages_as_dict)
-                eval_time_unix = int(time.time())
-                validation = validate_result(prompt_obj, response, canonical_snapshot, eval_time_unix=eval_time_unix)
-                provenance = classify_provenance(tool_used, validation)
-                data_hints = extract_data_hints_scratch(messages_as_dict)
-
-                validation_path = os.path.join(model_results_dir, f"{prompt_name}_validation.json")
-                with open(validation_path, "w") as f:
-                    json.dump(
-                        {
-                            "model": model_name,
-                            "prompt_name": prompt_name,
-                            "prompt_version": prompt_version,
-                            "run": {
-                                "run_group": run_group_id,
-                                "framework": "scratch",
-                                "started_at_human": run_started_human,
-                                "started_at_utc": run_started_utc,
-                            },
-                            "canonical": canonical_snapshot["prompts"].get(prompt_name, {}),
-                            "tool_used": tool_used,
-                            "tool_names": tool_names,
-                            "provenance": provenance,
-                            "eval_time_unix": eval_time_unix,
-                            "data_hints": data_hints,
-                            "validation": validation,
-                        },
-                        f,
-                        indent=2,
-                    )
+    ensure_dir(results_root)
 
-                logger.info("    Results saved to %s", log_path)
-                logger.info("    Validation saved to %s", validation_path)
+    run_meta = {
+        "run_group": run_group_id,
+        "framework": "scratch",
+        "started_at_human": run_started_human,
+        "started_at_utc": run_started_utc,
+    }
 
-            except Exception as e:
-                logger.exception(
-                    "    Error evaluating prompt '%s' for model %s: %s",
-                    prompt_text,
-                    model_name,
-                    e,
+    # The main thread only drives model calls; validation and result encoding run on
+    # consumer threads, and the encoded files are written on a background thread.
+    writer = BackgroundWriter()
+    jobs: queue.Queue = queue.Queue(maxsize=32)
+    consumers = [
+        threading.Thread(
+            target=_consume_results,
+            args=(jobs, canonical_snapshot, writer),
+            name=f"scratch-results-{i}",
+            daemon=True,
+        )
+        for i in range(RESULT_CONSUMERS)
+    ]
+    for consumer in consumers:
+        consumer.start()
+    try:
+        for model_name in models:
+            sanitized_model_name = sanitize_filename(model_name)
+            model_results_dir = os.path.join(results_root, sanitized_model_name)
+            ensure_dir(model_results_dir)
+            sidecar_base = {"model": model_name, "prompt_version": prompt_version, "run": run_meta}
+
+            logger.info("--- Running evaluation for model: %s ---", model_name)
+            for prompt_obj in prompts:
+                prompt_text = prompt_obj["text"]
+
+                logger.info("  - Running prompt: '%s'", prompt_text)
+                try:
+                    # Re-create agent for each prompt to ensure a clean state
+                    agent = create_agent(model_name)
+                    response = agent.run(prompt_text)
+                    # ISS validation interpolates against this time, so take it at answer time
+                    # rather than whenever a consumer gets to the result.
+                    eval_time_unix = int(time.time())
+                except Exception as e:
+                    logger.exception(
+                        "    Error evaluating prompt '%s' for model %s: %s",
+                        prompt_text,
+                        model_name,
+                        e,
+                    )
+                    continue
+
+                jobs.put(
+                    {
+                        "model_name": model_name,
+                        "prompt_obj": prompt_obj,
+                        "response": response,
+                        "messages": agent.messages,
+                        "eval_time_unix": eval_time_unix,
+                        "prefix": os.path.join(model_results_dir, prompt_obj["name"]),
+                        "run_meta": run_meta,
+                        "sidecar_base": sidecar_base,
+                    }
                 )
+    finally:
+        for _ in consumers:
+            jobs.put(None)
+        for consumer in consumers:
+            consumer.join()
+        writer.close()
+        finalize_manifest(run_dir)
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
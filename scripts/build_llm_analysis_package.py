@@ -97,6 +97,7 @@ Tooling context:
   - Canonical snapshot and canonical availability/errors; use to explain unverified rows.
 - `scratch_evaluation.log` / `strands_evaluation.log`:
   - Execution traces and errors; use for root-cause analysis, not primary scoring.
+  - `strands_evaluation.log` is JSON Lines (`ts`, `lvl`, `name`, `msg`); concurrent prompts interleave, so group by the model/prompt named in `msg`.
 - `LLM_CONTEXT_BUNDLE.md`:
   - Consolidated context file that includes:
     - interpretation guidance for this run
@@ -13,30 +13,75 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 from collections import Counter, defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 
+@dataclass(slots=True)
+class Row:
+    """Flattened view of one (framework, model, prompt) record used by the aggregations."""
+
+    framework: str
+    model: str
+    prompt: str
+    valid: bool | None
+    reason: str | None
+    provenance: str | None
+    assistant_turns: int
+    tool_calls: int
+    final_text_source: str | None
+
+
 def load_json(path: Path) -> Any:
     with path.open() as f:
         return json.load(f)
 
 
+def write_atomic(path: Path, text: str) -> None:
+    # Write beside the target and swap in, so readers never see a partial file.
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(text.encode("utf-8"))
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def save_json(path: Path, data: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w") as f:
-        json.dump(data, f, indent=2)
+    write_atomic(path, json.dumps(data, indent=2))
+
+
+_UNSAFE_FOLDER_CHARS = re.compile(r"[^-\w.]")
+_VALIDATION_RUN_ID = re.compile(r"_(\d{8}_\d{6})_validation\.json$")
+
+def _valid_code(v: Any) -> int:
+    # Identity checks, not a dict lookup: 1 and 0 hash like True and False, and must not
+    # count as a win.
+    return 2 if v is True else 1 if v is False else 0
+
+
+# Pairwise outcome lookup: index is (scratch_code << 2) | strands_code, where a
+# framework "wins" only when its valid is True and the other side's is not.
+_SCRATCH_WIN, _STRANDS_WIN, _TIE = 0, 1, 2
+_OUTCOME = [
+    _SCRATCH_WIN if s == 2 and t != 2 else _STRANDS_WIN if t == 2 and s != 2 else _TIE
+    for s in range(4)
+    for t in range(4)
+]
 
 
 def sanitize_model_folder(model: str) -> str:
-    return re.sub(r"(?u)[^-\w.]", "", model.replace(" ", "_"))
+    return _UNSAFE_FOLDER_CHARS.sub("", model.replace(" ", "_"))
 
 
 def extract_run_id(path: Path) -> str | None:
-    m = re.search(r"_(\d{8}_\d{6})_validation\.json$", path.name)
+    m = _VALIDATION_RUN_ID.search(path.name)
     return m.group(1) if m else None
 
 
@@ -46,7 +91,9 @@ def load_prompts(prompt_file: Path) -> list[str]:
 
 
 def choose_strands_run_id(base: Path, models: list[str], prompt_names: list[str]) -> tuple[str | None, dict[str, Any]]:
-    run_map: dict[str, set[tuple[str, str]]] = defaultdict(set)
+    # Group validation files by run id from their names alone, then read them
+    # newest run first so a fully covered recent run avoids touching older ones.
+    files_by_run: dict[str, list[Path]] = defaultdict(list)
     model_folders = [sanitize_model_folder(m) for m in models]
 
     for folder in model_folders:
@@ -55,8 +102,14 @@ def choose_strands_run_id(base: Path, models: list[str], prompt_names: list[str]
             continue
         for vf in model_dir.glob("*_validation.json"):
             run_id = extract_run_id(vf)
-            if not run_id:
-                continue
+            if run_id:
+                files_by_run[run_id].append(vf)
+
+    target = len(models) * len(prompt_names)
+    run_map: dict[str, set[tuple[str, str]]] = {}
+    for run_id in sorted(files_by_run, reverse=True):
+        keys: set[tuple[str, str]] = set()
+        for vf in files_by_run[run_id]:
             try:
                 payload = load_json(vf)
             except Exception:
@@ -64,19 +117,22 @@ def choose_strands_run_id(base: Path, models: list[str], prompt_names: list[str]
             model = payload.get("model")
             prompt_name = payload.get("prompt_name")
             if model in models and prompt_name in prompt_names:
-                run_map[run_id].add((model, prompt_name))
+                keys.add((model, prompt_name))
+        if keys:
+            run_map[run_id] = keys
+        if len(keys) == target:
+            break
 
     if not run_map:
         return None, {}
 
-    target = len(models) * len(prompt_names)
     ranked = sorted(run_map.items(), key=lambda kv: (len(kv[1]), kv[0]))
     best_run_id, keys = ranked[-1]
     return best_run_id, {
         "target_pairs": target,
         "best_pairs": len(keys),
         "coverage": round(len(keys) / target, 3) if target else 0.0,
-        "available_run_ids": sorted(run_map.keys()),
+        "available_run_ids": sorted(files_by_run.keys()),
     }
 
 
@@ -115,8 +171,9 @@ def load_record(
     model: str,
     prompt_name: str,
     run_id: str | None,
-) -> dict[str, Any] | None:
-    folder = base / framework / sanitize_model_folder(model)
+    folder_name: str,
+) -> Row | None:
+    folder = base / framework / folder_name
     if not folder.exists():
         return None
 
@@ -137,38 +194,42 @@ def load_record(
 
     metrics = parse_scratch_metrics(r) if framework == "scratch" else parse_strands_metrics(r)
     val = v.get("validation", {})
-    return {
-        "framework": framework,
-        "model": model,
-        "prompt_name": prompt_name,
-        "validation": val,
-        "provenance": v.get("provenance"),
-        "tool_used": v.get("tool_used"),
-        "tool_names": v.get("tool_names", []),
-        "eval_time_unix": v.get("eval_time_unix"),
-        "data_hints": v.get("data_hints", {}),
-        "metrics": metrics,
-        "paths": {
-            "validation": str(vf),
-            "result": str(rf),
-        },
-    }
+    return Row(
+        framework=framework,
+        model=model,
+        prompt=prompt_name,
+        valid=val.get("valid"),
+        reason=val.get("reason"),
+        provenance=v.get("provenance"),
+        assistant_turns=metrics.get("assistant_turns", 0),
+        tool_calls=metrics.get("tool_calls", 0),
+        final_text_source=metrics.get("final_text_source"),
+    )
 
 
-def summarize_model(records: list[dict[str, Any]]) -> dict[str, Any]:
-    verified = [r for r in records if r["validation"].get("valid") is not None]
-    valid = [r for r in verified if r["validation"].get("valid") is True]
-    reasons = Counter(r["validation"].get("reason") for r in records if r["validation"].get("valid") is False)
-    prov = Counter(r.get("provenance") for r in records)
-    avg_turns = round(sum(r["metrics"].get("assistant_turns", 0) for r in records) / len(records), 2) if records else 0.0
-    avg_tools = round(sum(r["metrics"].get("tool_calls", 0) for r in records) / len(records), 2) if records else 0.0
+def summarize_model(records: list[Row]) -> dict[str, Any]:
+    runs = len(records)
+    verified = valid = turns = tools = 0
+    reasons: Counter[str | None] = Counter()
+    prov: Counter[str | None] = Counter()
+    for r in records:
+        is_valid = r.valid
+        if is_valid is not None:
+            verified += 1
+            if is_valid is True:
+                valid += 1
+            elif is_valid is False:
+                reasons[r.reason] += 1
+        prov[r.provenance] += 1
+        turns += r.assistant_turns
+        tools += r.tool_calls
     return {
-        "runs": len(records),
-        "verified_runs": len(verified),
-        "valid_runs": len(valid),
-        "valid_rate_verified": round(len(valid) / len(verified), 3) if verified else None,
-        "avg_assistant_turns": avg_turns,
-        "avg_tool_calls": avg_tools,
+        "runs": runs,
+        "verified_runs": verified,
+        "valid_runs": valid,
+        "valid_rate_verified": round(valid / verified, 3) if verified else None,
+        "avg_assistant_turns": round(turns / runs, 2) if runs else 0.0,
+        "avg_tool_calls": round(tools / runs, 2) if runs else 0.0,
         "provenance": dict(prov),
         "fail_reasons": {str(k): v for k, v in reasons.items() if k is not None},
     }
@@ -285,35 +346,21 @@ def build_interpretation_guide(summary: dict[str, Any], summary_path: Path, mark
 """
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--models", nargs="+", required=True)
-    parser.add_argument("--prompts", default="prompts.json")
-    parser.add_argument(
-        "--run-group",
-        default="",
-        help="Run group id under evaluation_results/runs/<id>. If omitted, legacy root layout is used.",
-    )
-    args = parser.parse_args()
-
-    if args.run_group:
-        base = Path("evaluation_results") / "runs" / args.run_group
-    else:
-        base = Path("evaluation_results")
-    analysis_dir = base / "analysis"
-    prompt_file = Path(args.prompts)
-
+def build_summary(base: Path, models: list[str], prompt_file: Path, run_group: str = "") -> dict[str, Any]:
     prompt_names = load_prompts(prompt_file)
-    strands_run_id, strands_meta = choose_strands_run_id(base, args.models, prompt_names)
+    strands_run_id, strands_meta = choose_strands_run_id(base, models, prompt_names)
     if not strands_run_id:
         raise RuntimeError("No eligible Strands run found for requested models/prompts.")
 
-    rows: list[dict[str, Any]] = []
+    folders = {m: sanitize_model_folder(m) for m in models}
+    rows: list[Row] = []
     missing: list[dict[str, Any]] = []
-    for model in args.models:
+    pairwise: list[dict[str, Any]] = []
+    outcomes = [0, 0, 0]
+    for model in models:
         for prompt in prompt_names:
-            s = load_record("scratch", base, model, prompt, None)
-            t = load_record("strands", base, model, prompt, strands_run_id)
+            s = load_record("scratch", base, model, prompt, None, folders[model])
+            t = load_record("strands", base, model, prompt, strands_run_id, folders[model])
             if s is None:
                 missing.append({"framework": "scratch", "model": model, "prompt": prompt})
             else:
@@ -322,67 +369,63 @@ def main() -> None:
                 missing.append({"framework": "strands", "model": model, "prompt": prompt})
             else:
                 rows.append(t)
+            if s is None or t is None:
+                continue
+
+            # pairwise
+            sv = s.valid
+            tv = t.valid
+            outcomes[_OUTCOME[(_valid_code(sv) << 2) | _valid_code(tv)]] += 1
+            pairwise.append(
+                {
+                    "model": model,
+                    "prompt_name": prompt,
+                    "scratch_valid": sv,
+                    "strands_valid": tv,
+                    "scratch_reason": s.reason,
+                    "strands_reason": t.reason,
+                    "scratch_turns": s.assistant_turns,
+                    "strands_turns": t.assistant_turns,
+                    "scratch_tool_calls": s.tool_calls,
+                    "strands_tool_calls": t.tool_calls,
+                    "strands_final_text_source": t.final_text_source,
+                }
+            )
 
-    by_framework_model: dict[str, dict[str, list[dict[str, Any]]]] = {
+    by_framework_model: dict[str, dict[str, list[Row]]] = {
         "scratch": defaultdict(list),
         "strands": defaultdict(list),
     }
+    verified_counts: Counter[str] = Counter()
+    valid_counts: Counter[str] = Counter()
     for r in rows:
-        by_framework_model[r["framework"]][r["model"]].append(r)
+        framework = r.framework
+        by_framework_model[framework][r.model].append(r)
+        if r.valid is not None:
+            verified_counts[framework] += 1
+            if r.valid is True:
+                valid_counts[framework] += 1
 
     by_model: dict[str, Any] = {}
-    for model in args.models:
+    for model in models:
         by_model[model] = {
             "scratch": summarize_model(by_framework_model["scratch"].get(model, [])),
             "strands": summarize_model(by_framework_model["strands"].get(model, [])),
         }
 
-    # pairwise
-    scratch_wins = strands_wins = ties = 0
-    pairwise: list[dict[str, Any]] = []
-    index: dict[tuple[str, str, str], dict[str, Any]] = {(r["model"], r["prompt_name"], r["framework"]): r for r in rows}
-    for model in args.models:
-        for prompt in prompt_names:
-            s = index.get((model, prompt, "scratch"))
-            t = index.get((model, prompt, "strands"))
-            if not s or not t:
-                continue
-            sv = s["validation"].get("valid")
-            tv = t["validation"].get("valid")
-            if sv is True and tv is not True:
-                scratch_wins += 1
-            elif tv is True and sv is not True:
-                strands_wins += 1
-            else:
-                ties += 1
-            pairwise.append(
-                {
-                    "model": model,
-                    "prompt_name": prompt,
-                    "scratch_valid": sv,
-                    "strands_valid": tv,
-                    "scratch_reason": s["validation"].get("reason"),
-                    "strands_reason": t["validation"].get("reason"),
-                    "scratch_turns": s["metrics"].get("assistant_turns"),
-                    "strands_turns": t["metrics"].get("assistant_turns"),
-                    "scratch_tool_calls": s["metrics"].get("tool_calls"),
-                    "strands_tool_calls": t["metrics"].get("tool_calls"),
-                    "strands_final_text_source": t["metrics"].get("final_text_source"),
-                }
-            )
-
-    scratch_verified = sum(1 for r in rows if r["framework"] == "scratch" and r["validation"].get("valid") is not None)
-    strands_verified = sum(1 for r in rows if r["framework"] == "strands" and r["validation"].get("valid") is not None)
-    scratch_valid_verified = sum(1 for r in rows if r["framework"] == "scratch" and r["validation"].get("valid") is True)
-    strands_valid_verified = sum(1 for r in rows if r["framework"] == "strands" and r["validation"].get("valid") is True)
+    scratch_wins, strands_wins, ties = outcomes
+    scratch_verified = verified_counts["scratch"]
+    strands_verified = verified_counts["strands"]
+    scratch_valid_verified = valid_counts["scratch"]
+    strands_valid_verified = valid_counts["strands"]
 
     generated = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     summary = {
         "metadata": {
             "generated_at_utc": generated,
-            "run_group": args.run_group or None,
-            "expected_pairs_per_framework": len(args.models) * len(prompt_names),
-            "models": args.models,
+            "run_group": run_group or None,
+            "expected_pairs_per_framework": len(models) * len(prompt_names),
+            "models": models,
             "prompt_names": prompt_names,
             "prompt_file": str(prompt_file),
             "strands_run_id": strands_run_id,
@@ -401,18 +444,25 @@ def main() -> None:
         "pairwise": pairwise,
         "missing": missing,
     }
+    return summary
+
 
+def write_outputs(summary: dict[str, Any], base: Path) -> Path:
+    analysis_dir = base / "analysis"
     stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     out_json = analysis_dir / f"comparison_{stamp}.json"
     out_md = analysis_dir / f"comparison_{stamp}.md"
     out_guide = analysis_dir / f"interpretation_guide_{stamp}.md"
 
-    save_json(out_json, summary)
-    (out_md).write_text(build_markdown(summary, out_json))
-    (out_guide).write_text(build_interpretation_guide(summary, out_json, out_md))
+    summary_text = json.dumps(summary, indent=2)
+    analysis_dir.mkdir(parents=True, exist_ok=True)
+    write_atomic(out_json, summary_text)
+    write_atomic(out_md, build_markdown(summary, out_json))
+    write_atomic(out_guide, build_interpretation_guide(summary, out_json, out_md))
 
-    # compatibility outputs in the same base directory
-    save_json(base / "latest_comparison_summary.json", summary)
+    # compatibility outputs in the same base directory; written last so a failed
+    # run leaves latest_* pointing at the previous consistent summary
+    write_atomic(base / "latest_comparison_summary.json", summary_text)
     save_json(base / "latest_runtime_summary.json", {"note": "Use comparison summary metrics/tool-calls for runtime proxy in this version."})
 
     print(f"Wrote {out_json}")
@@ -420,6 +470,28 @@ def main() -> None:
     print(f"Wrote {out_guide}")
     print(f"Updated {base / 'latest_comparison_summary.json'}")
 
+    return out_json
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--models", nargs="+", required=True)
+    parser.add_argument("--prompts", default="prompts.json")
+    parser.add_argument(
+        "--run-group",
+        default="",
+        help="Run group id under evaluation_results/runs/<id>. If omitted, legacy root layout is used.",
+    )
+    args = parser.parse_args()
+
+    if args.run_group:
+        base = Path("evaluation_results") / "runs" / args.run_group
+    else:
+        base = Path("evaluation_results")
+
+    summary = build_summary(base, args.models, Path(args.prompts), args.run_group)
+    write_outputs(summary, base)
+
 
 if __name__ == "__main__":
     main()
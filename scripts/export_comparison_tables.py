@@ -38,10 +38,11 @@ def write_pairwise_csv(data: dict, out_path: Path) -> None:
         "strands_final_text_source",
     ]
     with out_path.open("w", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fields)
+        # Pairwise rows already use the column names; let the writer pick fields
+        # straight off each row instead of rebuilding a dict per row.
+        w = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
         w.writeheader()
-        for row in data.get("pairwise", []):
-            w.writerow({k: row.get(k) for k in fields})
+        w.writerows(data.get("pairwise", []))
 
 
 def write_model_csv(data: dict, out_path: Path) -> None:
@@ -82,6 +83,16 @@ def write_model_csv(data: dict, out_path: Path) -> None:
             )
 
 
+def export_tables(data: dict, comparison_path: Path, base: Path) -> tuple[Path, Path]:
+    stem = comparison_path.stem.replace("comparison_", "")
+    out_pairwise = base / "analysis" / f"turns_and_tools_{stem}.csv"
+    out_model = base / "analysis" / f"model_aggregate_{stem}.csv"
+
+    write_pairwise_csv(data, out_pairwise)
+    write_model_csv(data, out_model)
+    return out_pairwise, out_model
+
+
 def main() -> None:
     p = argparse.ArgumentParser()
     p.add_argument("--comparison", default="", help="Path to comparison JSON. Defaults to latest in analysis folder.")
@@ -95,13 +106,7 @@ def main() -> None:
     base = Path("evaluation_results") / "runs" / args.run_group if args.run_group else Path("evaluation_results")
     comparison_path = Path(args.comparison) if args.comparison else latest_comparison_json(base)
     data = load_json(comparison_path)
-
-    stem = comparison_path.stem.replace("comparison_", "")
-    out_pairwise = base / "analysis" / f"turns_and_tools_{stem}.csv"
-    out_model = base / "analysis" / f"model_aggregate_{stem}.csv"
-
-    write_pairwise_csv(data, out_pairwise)
-    write_model_csv(data, out_model)
+    out_pairwise, out_model = export_tables(data, comparison_path, base)
 
     print(f"comparison_json={comparison_path}")
     print(f"pairwise_csv={out_pairwise}")
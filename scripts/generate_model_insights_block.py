@@ -4,12 +4,22 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
 from datetime import datetime
 from pathlib import Path
 import glob
 
 
+_CARD_TEMPLATE = """#### {model}
+- Result: `{total_valid}/{total_runs}` valid (Scratch `{s_valid}/{s_runs}`, Strands `{t_valid}/{t_runs}`).
+- Tool profile: scratch `{s_style}` (avg tool calls `{s_tools}`), strands `{t_style}` (avg tool calls `{t_tools}`).
+- Failure signals: scratch `{s_reasons}`, strands `{t_reasons}`.
+- Verdict: `{verdict}`.
+
+"""
+
+
 def load_json(path: Path) -> dict:
     with path.open() as f:
         return json.load(f)
@@ -89,42 +99,50 @@ def build_markdown(
     strands_valid = int(overall.get("strands_valid_verified", 0))
     strands_runs = int(overall.get("strands_verified", 0))
 
-    scratch_wins, strands_wins, ties = pairwise_counts(comparison.get("pairwise", []))
+    if all(k in overall for k in ("scratch_wins", "strands_wins", "ties")):
+        # compare_framework_runs already tallied the pairwise outcomes
+        scratch_wins = int(overall["scratch_wins"])
+        strands_wins = int(overall["strands_wins"])
+        ties = int(overall["ties"])
+    else:
+        scratch_wins, strands_wins, ties = pairwise_counts(comparison.get("pairwise", []))
 
     prompt_version = prompts.get("version", "unknown")
     prompt_names = [p.get("name", "unknown_prompt") for p in prompts.get("prompts", [])]
 
-    lines: list[str] = []
-    lines.append(f"\n## Run Update: `{tag}`")
-    lines.append("")
-    lines.append("### Data Tag")
-    lines.append(f"- Evaluation tag: `{tag}`")
-    lines.append(f"- Prompt set: `prompts.json` (version `{prompt_version}`)")
-    lines.append("- Prompts:")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"""
+## Run Update: `{tag}`
+
+### Data Tag
+- Evaluation tag: `{tag}`
+- Prompt set: `prompts.json` (version `{prompt_version}`)
+- Prompts:
+""")
     for name in prompt_names:
-        lines.append(f"  - `{name}`")
-    lines.append("- Frameworks compared:")
-    lines.append("  - Scratch: `scratch_foundry/run_evaluation.py`")
-    lines.append("  - Strands: `strands_foundry/run_strands_evaluation.py`")
-    lines.append("- Canonical snapshot: `" + canonical_path + "`")
-    lines.append("- Generated summaries used:")
-    lines.append("  - `" + comparison_path + "`")
-    lines.append("- Scope caveat:")
-    lines.append("  - Single cohort; treat as operational tool-use signal, not broad capability ranking.")
-    lines.append("")
-
-    lines.append("### Scorecard Snapshot")
-    lines.append("- Overall valid outputs:")
-    lines.append(f"  - Scratch: `{scratch_valid}/{scratch_runs}`")
-    lines.append(f"  - Strands: `{strands_valid}/{strands_runs}`")
-    lines.append(f"- Pairwise head-to-head (`{len(comparison.get('pairwise', []))}` model-prompt pairs):")
-    lines.append(f"  - Scratch wins: `{scratch_wins}`")
-    lines.append(f"  - Strands wins: `{strands_wins}`")
-    lines.append(f"  - Ties: `{ties}`")
-    lines.append("")
-
-    lines.append("### Capability Cards")
-    lines.append("")
+        w(f"  - `{name}`\n")
+    w(f"""- Frameworks compared:
+  - Scratch: `scratch_foundry/run_evaluation.py`
+  - Strands: `strands_foundry/run_strands_evaluation.py`
+- Canonical snapshot: `{canonical_path}`
+- Generated summaries used:
+  - `{comparison_path}`
+- Scope caveat:
+  - Single cohort; treat as operational tool-use signal, not broad capability ranking.
+
+### Scorecard Snapshot
+- Overall valid outputs:
+  - Scratch: `{scratch_valid}/{scratch_runs}`
+  - Strands: `{strands_valid}/{strands_runs}`
+- Pairwise head-to-head (`{len(comparison.get('pairwise', []))}` model-prompt pairs):
+  - Scratch wins: `{scratch_wins}`
+  - Strands wins: `{strands_wins}`
+  - Ties: `{ties}`
+
+### Capability Cards
+
+""")
 
     for model in all_models:
         rec = by_model.get(model, {})
@@ -135,27 +153,42 @@ def build_markdown(
         s_runs = int(s.get("verified_runs", 0))
         t_runs = int(t.get("verified_runs", 0))
 
-        lines.append(f"#### {model}")
-        lines.append(
-            f"- Result: `{s_valid + t_valid}/{s_runs + t_runs}` valid "
-            f"(Scratch `{s_valid}/{s_runs}`, Strands `{t_valid}/{t_runs}`)."
+        w(
+            _CARD_TEMPLATE.format(
+                model=model,
+                total_valid=s_valid + t_valid,
+                total_runs=s_runs + t_runs,
+                s_valid=s_valid,
+                s_runs=s_runs,
+                t_valid=t_valid,
+                t_runs=t_runs,
+                s_style=tool_style(s),
+                t_style=tool_style(t),
+                s_tools=s.get("avg_tool_calls", 0),
+                t_tools=t.get("avg_tool_calls", 0),
+                s_reasons=reason_line(s),
+                t_reasons=reason_line(t),
+                verdict=verdict_label(s_valid, s_runs, t_valid, t_runs),
+            )
         )
-        lines.append(
-            f"- Tool profile: scratch `{tool_style(s)}` (avg tool calls `{s.get('avg_tool_calls', 0)}`), "
-            f"strands `{tool_style(t)}` (avg tool calls `{t.get('avg_tool_calls', 0)}`)."
-        )
-        lines.append(
-            f"- Failure signals: scratch `{reason_line(s)}`, strands `{reason_line(t)}`."
-        )
-        lines.append(f"- Verdict: `{verdict_label(s_valid, s_runs, t_valid, t_runs)}`.")
-        lines.append("")
 
-    lines.append("### Notes For Next Run")
-    lines.append("- Add rubric auto-scoring and include numeric per-model totals.")
-    lines.append("- Include at least one retry/error-injection prompt to test recovery behavior.")
-    lines.append("- Add Anthropic models for a wider reasoning baseline.")
+    w("""### Notes For Next Run
+- Add rubric auto-scoring and include numeric per-model totals.
+- Include at least one retry/error-injection prompt to test recovery behavior.
+- Add Anthropic models for a wider reasoning baseline.
+""")
+    return buf.getvalue()
+
 
-    return "\n".join(lines) + "\n"
+def emit_block(block: str, append: str = "") -> None:
+    if append:
+        out = Path(append)
+        with out.open("a") as f:
+            f.write("\n")
+            f.write(block)
+        print(f"Appended generated block to {out}")
+    else:
+        print(block)
 
 
 def main() -> None:
@@ -206,14 +239,7 @@ def main() -> None:
         str(comparison_path),
     )
 
-    if args.append:
-        out = Path(args.append)
-        with out.open("a") as f:
-            f.write("\n")
-            f.write(block)
-        print(f"Appended generated block to {out}")
-    else:
-        print(block)
+    emit_block(block, args.append)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Run comparison, CSV export, and model-insights generation in one process.
+
+Equivalent to running `compare_framework_runs.py`, `export_comparison_tables.py`,
+and `generate_model_insights_block.py` back to back, but hands the in-memory
+summary from one step to the next instead of re-reading `comparison_*.json`.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from compare_framework_runs import build_summary, load_json, write_outputs
+from export_comparison_tables import export_tables
+from generate_model_insights_block import build_markdown, emit_block
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare runs, export CSV tables, and build the model-insights block.")
+    parser.add_argument("--models", nargs="+", required=True)
+    parser.add_argument("--prompts", default="prompts.json")
+    parser.add_argument(
+        "--run-group",
+        default="",
+        help="Run group id under evaluation_results/runs/<id>. If omitted, legacy root layout is used.",
+    )
+    parser.add_argument(
+        "--canonical",
+        default="evaluation_results/runs/<run_group>/canonical/canonical_<prompt_version>.json",
+        help="Canonical snapshot path to reference in the insights block.",
+    )
+    parser.add_argument(
+        "--tag",
+        default=f"latent-logic_eval_{datetime.now().strftime('%Y-%m-%d')}_auto",
+        help="Run tag used in the insights section heading.",
+    )
+    parser.add_argument(
+        "--append",
+        default="",
+        help="If set, append the insights block to this file instead of printing it.",
+    )
+    args = parser.parse_args()
+
+    base = Path("evaluation_results") / "runs" / args.run_group if args.run_group else Path("evaluation_results")
+    prompt_file = Path(args.prompts)
+
+    summary = build_summary(base, args.models, prompt_file, args.run_group)
+    comparison_path = write_outputs(summary, base)
+
+    out_pairwise, out_model = export_tables(summary, comparison_path, base)
+    print(f"pairwise_csv={out_pairwise}")
+    print(f"model_csv={out_model}")
+
+    block = build_markdown(summary, load_json(prompt_file), args.tag, args.canonical, str(comparison_path))
+    emit_block(block, args.append)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
+import functools
 import logging
+import re
+from collections.abc import Callable
 from typing import Any
 
-import openai
-
 from strands.types.exceptions import ContextWindowOverflowException, ModelThrottledException
 
 logger = logging.getLogger(__name__)
@@ -12,31 +13,58 @@ _CONTEXT_OVERFLOW_MESSAGES = [
     "input length and `max_tokens` exceed context limit",
     "too many total text bytes",
 ]
+_CONTEXT_OVERFLOW_RE = re.compile("|".join(map(re.escape, _CONTEXT_OVERFLOW_MESSAGES)))
 
 
-def normalize_openai_exception(exc: Exception) -> Exception:
-    """Normalize OpenAI-compatible exceptions into Strands exceptions."""
-    if isinstance(exc, openai.BadRequestError):
-        # Some providers throw a BadRequest for context overflow
-        if hasattr(exc, "code") and exc.code == "context_length_exceeded":
-            logger.warning("context window overflow detected")
-            return ContextWindowOverflowException(str(exc))
-        return exc
-
-    if isinstance(exc, openai.RateLimitError):
-        logger.warning("rate limit detected")
-        return ModelThrottledException(str(exc))
-
-    if isinstance(exc, openai.APIError):
-        message = str(exc)
-        if any(m in message for m in _CONTEXT_OVERFLOW_MESSAGES):
-            logger.warning("context window overflow detected")
-            return ContextWindowOverflowException(message)
-        return exc
+def _handle_bad_request(exc: Exception) -> Exception:
+    # Some providers throw a BadRequest for context overflow
+    if hasattr(exc, "code") and exc.code == "context_length_exceeded":
+        logger.warning("context window overflow detected")
+        return ContextWindowOverflowException(str(exc))
+    return exc
+
+
+def _handle_rate_limit(exc: Exception) -> Exception:
+    logger.warning("rate limit detected")
+    return ModelThrottledException(str(exc))
+
 
+def _handle_api_error(exc: Exception) -> Exception:
+    message = str(exc)
+    if _CONTEXT_OVERFLOW_RE.search(message):
+        logger.warning("context window overflow detected")
+        return ContextWindowOverflowException(message)
     return exc
 
 
+@functools.cache
+def _handlers() -> dict[type[Exception], Callable[[Exception], Exception]]:
+    # openai is imported on first use; by then a client call has already loaded it.
+    import openai
+
+    # Most specific first: BadRequestError and RateLimitError both subclass APIError.
+    return {
+        openai.BadRequestError: _handle_bad_request,
+        openai.RateLimitError: _handle_rate_limit,
+        openai.APIError: _handle_api_error,
+    }
+
+
+def normalize_openai_exception(exc: Exception) -> Exception:
+    """Normalize OpenAI-compatible exceptions into Strands exceptions."""
+    handlers = _handlers()
+    handler = handlers.get(type(exc))
+    if handler is None:
+        # Subclasses (e.g. APIConnectionError) fall back to the first matching base.
+        for exc_type, candidate in handlers.items():
+            if isinstance(exc, exc_type):
+                handler = candidate
+                break
+        else:
+            return exc
+    return handler(exc)
+
+
 def raise_if_normalized(exc: Exception) -> None:
     normalized = normalize_openai_exception(exc)
     if normalized is exc:
@@ -1,13 +1,12 @@
-import json
+import asyncio
 import logging
 import os
 import uuid
-from collections.abc import AsyncGenerator, AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, Literal, TypedDict, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, TypeVar, cast
 
-import openai
 from pydantic import BaseModel
 
 from strands.models.model import Model
@@ -17,7 +16,12 @@ from strands.types.streaming import StreamEvent
 from strands.types.tools import ToolChoice, ToolSpec
 
 from .errors import raise_if_normalized
-from .message_format import format_request_messages, format_tools, format_tool_choice
+from .json_codec import JSONDecodeError, dumps, loads
+from .message_format import DumpsMemo, format_request_messages, format_tools, format_tool_choice
+
+if TYPE_CHECKING:
+    import httpx
+    import openai
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +42,94 @@ class _ToolCallCandidate:
     arguments_json: str
 
 
+class _DeltaBuffer:
+    """Coalesces streamed text/reasoning deltas into fewer, larger events.
+
+    Providers often stream one token per chunk; emitting a StreamEvent for each
+    costs the consumer an iteration and dict build per token.
+    """
+
+    def __init__(self, flush_chars: int = 256) -> None:
+        self.flush_chars = flush_chars
+        self.parts: list[str] = []
+        self.size = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.parts)
+
+    def add(self, text: str) -> bool:
+        """Buffer text and report whether the buffer has reached its flush size."""
+        self.parts.append(text)
+        self.size += len(text)
+        return self.size >= self.flush_chars
+
+    def drain(self) -> str:
+        text = "".join(self.parts)
+        self.parts.clear()
+        self.size = 0
+        return text
+
+
+def _message_start_chunk(data: Any, data_type: str | None) -> StreamEvent:
+    return {"messageStart": {"role": "assistant"}}
+
+
+def _content_start_chunk(data: Any, data_type: str | None) -> StreamEvent:
+    if data_type == "tool":
+        return {
+            "contentBlockStart": {
+                "start": {"toolUse": {"name": data["name"], "toolUseId": data["toolUseId"]}}
+            }
+        }
+    return {"contentBlockStart": {"start": {}}}
+
+
+def _text_delta(data: Any) -> dict[str, Any]:
+    return {"text": data}
+
+
+_DELTA_BUILDERS: dict[str | None, Callable[[Any], dict[str, Any]]] = {
+    "tool": lambda data: {"toolUse": {"input": data}},
+    "reasoning_content": lambda data: {"reasoningContent": {"text": data}},
+}
+
+
+def _content_delta_chunk(data: Any, data_type: str | None) -> StreamEvent:
+    return {"contentBlockDelta": {"delta": _DELTA_BUILDERS.get(data_type, _text_delta)(data)}}
+
+
+def _content_stop_chunk(data: Any, data_type: str | None) -> StreamEvent:
+    return {"contentBlockStop": {}}
+
+
+def _message_stop_chunk(data: Any, data_type: str | None) -> StreamEvent:
+    return {"messageStop": {"stopReason": data}}
+
+
+def _metadata_chunk(data: Any, data_type: str | None) -> StreamEvent:
+    return {
+        "metadata": {
+            "usage": {
+                "inputTokens": data.prompt_tokens,
+                "outputTokens": data.completion_tokens,
+                "totalTokens": data.total_tokens,
+            },
+            "metrics": {"latencyMs": 0},
+        }
+    }
+
+
+# chunk_type -> builder(data, data_type); one hash lookup per streamed event.
+_CHUNK_BUILDERS: dict[str, Callable[[Any, str | None], StreamEvent]] = {
+    "message_start": _message_start_chunk,
+    "content_start": _content_start_chunk,
+    "content_delta": _content_delta_chunk,
+    "content_stop": _content_stop_chunk,
+    "message_stop": _message_stop_chunk,
+    "metadata": _metadata_chunk,
+}
+
+
 class FoundryCompletionsModel(Model):
     """Custom Strands model provider for Azure Foundry OpenAI-compatible endpoints.
 
@@ -46,8 +138,17 @@ class FoundryCompletionsModel(Model):
     JSON tool request into a Strands toolUse block.
     """
 
-    def __init__(self, **model_config: Any) -> None:
+    def __init__(self, *, http_client: "httpx.AsyncClient | None" = None, **model_config: Any) -> None:
         self.config: FoundryConfig = {}
+        # Optional caller-owned connection pool, e.g. one shared by every deployment on an
+        # endpoint. Like any httpx.AsyncClient it must stay on a single event loop, and the
+        # caller is responsible for closing it. Without one, each call opens and closes
+        # its own client.
+        self._http_client = http_client
+        self._client: "openai.AsyncOpenAI | None" = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        # Serialized tool payloads of the conversations this model is serving.
+        self._dumps_memo: DumpsMemo = {}
         self.update_config(**model_config)
 
         if not self.config.get("endpoint"):
@@ -60,16 +161,50 @@ class FoundryCompletionsModel(Model):
 
     def update_config(self, **model_config: Any) -> None:
         self.config.update(cast(FoundryConfig, model_config))
+        # endpoint/api_key may have changed; build a fresh client on next use
+        self._client = None
 
     def get_config(self) -> FoundryConfig:
         return cast(FoundryConfig, self.config)
 
-    @asynccontextmanager
-    async def _get_client(self) -> AsyncIterator[Any]:
-        async with openai.AsyncOpenAI(
+    def clear_format_cache(self) -> None:
+        """Drop memoized tool payload JSON; call when an agent using this model is reset."""
+        self._dumps_memo.clear()
+
+    def _new_client(self) -> "openai.AsyncOpenAI":
+        # Imported here so loading the provider does not pay openai's import cost.
+        import openai
+
+        return openai.AsyncOpenAI(
             api_key=self.config.get("api_key"),
             base_url=self.config.get("endpoint"),
-        ) as client:
+            http_client=self._http_client,
+        )
+
+    def _client_for_running_loop(self) -> "openai.AsyncOpenAI":
+        # The caller's pool is bound to the event loop it first ran on. Reuse one client
+        # around it for every call on that loop, and refuse any other loop rather than
+        # hand httpx connections it cannot drive.
+        loop = asyncio.get_running_loop()
+        if self._client_loop is None:
+            self._client_loop = loop
+        elif self._client_loop is not loop:
+            raise RuntimeError(
+                "FoundryCompletionsModel http_client is bound to another event loop; "
+                "create the model (and its http_client) on the loop that uses it"
+            )
+        if self._client is None:
+            self._client = self._new_client()
+        return self._client
+
+    @asynccontextmanager
+    async def _get_client(self) -> AsyncIterator[Any]:
+        if self._http_client is not None:
+            yield self._client_for_running_loop()
+            return
+        # Without a caller-owned pool the client lives for this one call: Strands may run
+        # the next call on a fresh event loop, where this client's pool would be unusable.
+        async with self._new_client() as client:
             yield client
 
     def _build_request(
@@ -86,6 +221,7 @@ class FoundryCompletionsModel(Model):
                 messages,
                 system_prompt,
                 system_prompt_content=system_prompt_content,
+                dumps_memo=self._dumps_memo,
             ),
             "model": self.config["model_id"],
             "stream": True,
@@ -96,16 +232,20 @@ class FoundryCompletionsModel(Model):
         }
 
     def _parse_deepseek_tool_call(self, content: str) -> _ToolCallCandidate | None:
+        # Cheap pre-checks so ordinary prose answers never reach the JSON parser.
+        if not content.lstrip().startswith("{") or '"tool_name"' not in content:
+            return None
+
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError:
+            data = loads(content)
+        except JSONDecodeError:
             return None
 
         if not isinstance(data, dict):
             return None
 
         if "tool_name" in data and "tool_arguments" in data:
-            return _ToolCallCandidate(name=data["tool_name"], arguments_json=json.dumps(data["tool_arguments"]))
+            return _ToolCallCandidate(name=data["tool_name"], arguments_json=dumps(data["tool_arguments"]))
 
         return None
 
@@ -121,44 +261,10 @@ class FoundryCompletionsModel(Model):
         return False
 
     def _format_chunk(self, chunk_type: str, data: Any = None, data_type: str | None = None) -> StreamEvent:
-        if chunk_type == "message_start":
-            return {"messageStart": {"role": "assistant"}}
-
-        if chunk_type == "content_start":
-            if data_type == "tool":
-                return {
-                    "contentBlockStart": {
-                        "start": {"toolUse": {"name": data["name"], "toolUseId": data["toolUseId"]}}
-                    }
-                }
-            return {"contentBlockStart": {"start": {}}}
-
-        if chunk_type == "content_delta":
-            if data_type == "tool":
-                return {"contentBlockDelta": {"delta": {"toolUse": {"input": data}}}}
-            if data_type == "reasoning_content":
-                return {"contentBlockDelta": {"delta": {"reasoningContent": {"text": data}}}}
-            return {"contentBlockDelta": {"delta": {"text": data}}}
-
-        if chunk_type == "content_stop":
-            return {"contentBlockStop": {}}
-
-        if chunk_type == "message_stop":
-            return {"messageStop": {"stopReason": data}}
-
-        if chunk_type == "metadata":
-            return {
-                "metadata": {
-                    "usage": {
-                        "inputTokens": data.prompt_tokens,
-                        "outputTokens": data.completion_tokens,
-                        "totalTokens": data.total_tokens,
-                    },
-                    "metrics": {"latencyMs": 0},
-                }
-            }
-
-        raise RuntimeError(f"unknown chunk_type: {chunk_type}")
+        builder = _CHUNK_BUILDERS.get(chunk_type)
+        if builder is None:
+            raise RuntimeError(f"unknown chunk_type: {chunk_type}")
+        return builder(data, data_type)
 
     async def stream(
         self,
@@ -189,40 +295,56 @@ class FoundryCompletionsModel(Model):
             tool_calls: dict[int, list[Any]] = {}
             data_type: str | None = None
             finish_reason: str | None = None
-            final_text = ""
-            event = None
+            final_text_parts: list[str] = []
+            pending = _DeltaBuffer()
+            usage = None
 
+            # Read the stream to the end in one pass: with include_usage the provider sends
+            # a choices-less usage chunk after the finish_reason chunk.
             async for event in response:
-                if not getattr(event, "choices", None):
+                if getattr(event, "usage", None):
+                    usage = event.usage
+                if finish_reason is not None or not getattr(event, "choices", None):
                     continue
 
                 choice = event.choices[0]
 
                 if hasattr(choice.delta, "reasoning_content") and choice.delta.reasoning_content:
                     if data_type != "reasoning_content":
+                        if pending:
+                            yield self._format_chunk("content_delta", data=pending.drain(), data_type=data_type)
                         if data_type is not None:
                             yield self._format_chunk("content_stop", data_type=data_type)
                         yield self._format_chunk("content_start", data_type="reasoning_content")
                     data_type = "reasoning_content"
-                    yield self._format_chunk("content_delta", data=choice.delta.reasoning_content, data_type=data_type)
+                    if pending.add(choice.delta.reasoning_content):
+                        yield self._format_chunk("content_delta", data=pending.drain(), data_type=data_type)
 
                 if choice.delta.content:
                     if data_type != "text":
+                        if pending:
+                            yield self._format_chunk("content_delta", data=pending.drain(), data_type=data_type)
                         if data_type is not None:
                             yield self._format_chunk("content_stop", data_type=data_type)
                         yield self._format_chunk("content_start", data_type="text")
                     data_type = "text"
-                    final_text += choice.delta.content
-                    yield self._format_chunk("content_delta", data=choice.delta.content, data_type=data_type)
+                    final_text_parts.append(choice.delta.content)
+                    if pending.add(choice.delta.content):
+                        yield self._format_chunk("content_delta", data=pending.drain(), data_type=data_type)
 
                 for tool_call in choice.delta.tool_calls or []:
                     tool_calls.setdefault(tool_call.index, []).append(tool_call)
 
                 if choice.finish_reason:
                     finish_reason = choice.finish_reason
+                    if pending:
+                        yield self._format_chunk("content_delta", data=pending.drain(), data_type=data_type)
                     if data_type is not None:
                         yield self._format_chunk("content_stop", data_type=data_type)
-                    break
+
+            if pending:
+                # stream ended without a finish_reason; still deliver buffered text
+                yield self._format_chunk("content_delta", data=pending.drain(), data_type=data_type)
 
             # Emit tool calls from standard OpenAI-compatible tool_calls
             for tool_deltas in tool_calls.values():
@@ -244,6 +366,7 @@ class FoundryCompletionsModel(Model):
                 yield self._format_chunk("content_stop", data_type="tool")
 
             # DeepSeek JSON fallback
+            final_text = "".join(final_text_parts)
             if not tool_calls and final_text and self._should_apply_deepseek_mode(finish_reason, final_text):
                 candidate = self._parse_deepseek_tool_call(final_text)
                 if candidate:
@@ -273,12 +396,8 @@ class FoundryCompletionsModel(Model):
 
                 yield self._format_chunk("message_stop", data=stop_reason)
 
-            # Drain response for usage
-            async for event in response:
-                _ = event
-
-            if event and hasattr(event, "usage") and event.usage:
-                yield self._format_chunk("metadata", data=event.usage)
+            if usage:
+                yield self._format_chunk("metadata", data=usage)
 
     async def structured_output(
         self,
@@ -0,0 +1,31 @@
+"""JSON encode/decode helpers for the provider hot paths.
+
+Uses orjson when it is installed and falls back to the stdlib otherwise. Both
+paths emit compact JSON text; orjson's decode error subclasses
+json.JSONDecodeError, so callers only need to catch the stdlib type.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup, not a project dependency
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    loads = orjson.loads
+
+else:
+
+    def dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    loads = json.loads
@@ -1,35 +1,70 @@
-import json
+import binascii
+import functools
 import logging
 import mimetypes
-import base64
 from typing import Any
 
 from strands.types.content import ContentBlock, Messages, SystemContentBlock
 from strands.types.tools import ToolChoice, ToolResult, ToolSpec, ToolUse
 
+from .json_codec import dumps
+
 logger = logging.getLogger(__name__)
 
+# MIME types for the image/document formats Strands content blocks can carry.
+_FMT_TO_MIME = {
+    fmt: mimetypes.types_map.get(f".{fmt}", "application/octet-stream")
+    for fmt in ("png", "jpeg", "jpg", "gif", "webp", "pdf", "csv", "doc", "docx", "xls", "xlsx", "html", "txt", "md")
+}
+
+# A DumpsMemo maps the id() of a tool input/result payload to (payload, serialized JSON).
+# Strands resends the same history objects every turn, so each payload is dumped once
+# per conversation; the payload is kept in the entry so its id cannot be recycled while
+# memoized. Tool-use ids are not used as keys because some providers reuse them across
+# turns. The memo belongs to the caller (the model), which clears it when conversations
+# end, so it never outlives the histories it serves.
+DumpsMemo = dict[int, tuple[Any, str]]
+_DUMPS_MEMO_SIZE = 4096
+
+
+def _dumps_cached(payload: Any, memo: DumpsMemo | None) -> str:
+    if memo is None:
+        return dumps(payload)
+    entry = memo.get(id(payload))
+    if entry is not None and entry[0] is payload:
+        return entry[1]
+
+    text = dumps(payload)
+    if len(memo) >= _DUMPS_MEMO_SIZE:
+        memo.clear()
+    memo[id(payload)] = (payload, text)
+    return text
+
+
+def _data_url(mime_type: str, data: bytes) -> str:
+    # b2a_base64 skips b64encode's extra translate step; the output is pure ASCII.
+    encoded = binascii.b2a_base64(memoryview(data), newline=False).decode("ascii")
+    return "".join(("data:", mime_type, ";base64,", encoded))
+
 
 def _format_message_content(content: ContentBlock) -> dict[str, Any]:
     if "document" in content:
-        mime_type = mimetypes.types_map.get(f".{content['document']['format']}", "application/octet-stream")
-        file_data = base64.b64encode(content["document"]["source"]["bytes"]).decode("utf-8")
+        mime_type = _FMT_TO_MIME.get(content["document"]["format"], "application/octet-stream")
         return {
             "file": {
-                "file_data": f"data:{mime_type};base64,{file_data}",
+                "file_data": _data_url(mime_type, content["document"]["source"]["bytes"]),
                 "filename": content["document"]["name"],
             },
             "type": "file",
         }
 
     if "image" in content:
-        mime_type = mimetypes.types_map.get(f".{content['image']['format']}", "application/octet-stream")
-        image_data = base64.b64encode(content["image"]["source"]["bytes"]).decode("utf-8")
+        mime_type = _FMT_TO_MIME.get(content["image"]["format"], "application/octet-stream")
         return {
             "image_url": {
                 "detail": "auto",
                 "format": mime_type,
-                "url": f"data:{mime_type};base64,{image_data}",
+                "url": _data_url(mime_type, content["image"]["source"]["bytes"]),
             },
             "type": "image_url",
         }
@@ -40,10 +75,10 @@ def _format_message_content(content: ContentBlock) -> dict[str, Any]:
     raise TypeError(f"unsupported content type: {next(iter(content))}")
 
 
-def _format_tool_call(tool_use: ToolUse) -> dict[str, Any]:
+def _format_tool_call(tool_use: ToolUse, memo: DumpsMemo | None) -> dict[str, Any]:
     return {
         "function": {
-            "arguments": json.dumps(tool_use["input"]),
+            "arguments": _dumps_cached(tool_use["input"], memo),
             "name": tool_use["name"],
         },
         "id": tool_use["toolUseId"],
@@ -51,9 +86,9 @@ def _format_tool_call(tool_use: ToolUse) -> dict[str, Any]:
     }
 
 
-def _format_tool_message(tool_result: ToolResult) -> dict[str, Any]:
+def _format_tool_message(tool_result: ToolResult, memo: DumpsMemo | None) -> dict[str, Any]:
     contents = [
-        {"text": json.dumps(content["json"]) } if "json" in content else content
+        {"text": _dumps_cached(content["json"], memo)} if "json" in content else content
         for content in tool_result["content"]
     ]
 
@@ -64,19 +99,24 @@ def _format_tool_message(tool_result: ToolResult) -> dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=64)
+def _system_messages(texts: tuple[str, ...]) -> tuple[dict[str, Any], ...]:
+    # The system prompt is the same on every turn of a session; the message dicts
+    # are shared across requests and only ever read by the client.
+    return tuple({"role": "system", "content": text} for text in texts if text)
+
+
 def _format_system_messages(
     system_prompt: str | None,
     *,
     system_prompt_content: list[SystemContentBlock] | None = None,
 ) -> list[dict[str, Any]]:
     if system_prompt and system_prompt_content is None:
-        system_prompt_content = [{"text": system_prompt}]
+        texts: tuple[str, ...] = (system_prompt,)
+    else:
+        texts = tuple(content["text"] for content in system_prompt_content or [] if "text" in content)
 
-    return [
-        {"role": "system", "content": content["text"]}
-        for content in system_prompt_content or []
-        if "text" in content
-    ]
+    return list(_system_messages(texts))
 
 
 def format_request_messages(
@@ -84,28 +124,37 @@ def format_request_messages(
     system_prompt: str | None,
     *,
     system_prompt_content: list[SystemContentBlock] | None = None,
+    dumps_memo: DumpsMemo | None = None,
 ) -> list[dict[str, Any]]:
     formatted_messages = _format_system_messages(system_prompt, system_prompt_content=system_prompt_content)
 
     for message in messages:
-        contents = message["content"]
-        filtered = [c for c in contents if not any(k in c for k in ["toolResult", "toolUse", "reasoningContent"])]
-
-        formatted_contents = [_format_message_content(c) for c in filtered]
-        tool_calls = [_format_tool_call(c["toolUse"]) for c in contents if "toolUse" in c]
-        tool_messages = [_format_tool_message(c["toolResult"]) for c in contents if "toolResult" in c]
-
-        formatted_messages.append(
-            {
-                "role": message["role"],
-                "content": formatted_contents,
-                **({"tool_calls": tool_calls} if tool_calls else {}),
-            }
-        )
+        formatted_contents = []
+        tool_calls = []
+        tool_messages = []
+        for c in message["content"]:
+            if "toolUse" in c:
+                tool_calls.append(_format_tool_call(c["toolUse"], dumps_memo))
+            elif "toolResult" in c:
+                tool_message = _format_tool_message(c["toolResult"], dumps_memo)
+                if tool_message["content"]:
+                    tool_messages.append(tool_message)
+            elif "reasoningContent" not in c:
+                formatted_contents.append(_format_message_content(c))
+
+        # Messages left with neither content nor tool calls are never sent.
+        if formatted_contents or tool_calls:
+            formatted_messages.append(
+                {
+                    "role": message["role"],
+                    "content": formatted_contents,
+                    **({"tool_calls": tool_calls} if tool_calls else {}),
+                }
+            )
 
         formatted_messages.extend(tool_messages)
 
-    return [m for m in formatted_messages if m.get("content") or "tool_calls" in m]
+    return formatted_messages
 
 
 def format_tools(tool_specs: list[ToolSpec] | None) -> list[dict[str, Any]]:
@@ -122,16 +171,21 @@ def format_tools(tool_specs: list[ToolSpec] | None) -> list[dict[str, Any]]:
     ]
 
 
+# Shared, never mutated: _build_request only **-splats these into the request dict.
+_TOOL_CHOICE_AUTO: dict[str, Any] = {"tool_choice": "auto"}
+_TOOL_CHOICE_REQUIRED: dict[str, Any] = {"tool_choice": "required"}
+
+
 def format_tool_choice(tool_choice: ToolChoice | None) -> dict[str, Any]:
     if not tool_choice:
         return {}
 
-    match tool_choice:
-        case {"auto": _}:
-            return {"tool_choice": "auto"}
-        case {"any": _}:
-            return {"tool_choice": "required"}
-        case {"tool": {"name": tool_name}}:
-            return {"tool_choice": {"type": "function", "function": {"name": tool_name}}}
-        case _:
-            return {"tool_choice": "auto"}
+    if "auto" in tool_choice:
+        return _TOOL_CHOICE_AUTO
+    if "any" in tool_choice:
+        return _TOOL_CHOICE_REQUIRED
+
+    tool = tool_choice.get("tool")
+    if isinstance(tool, dict) and "name" in tool:
+        return {"tool_choice": {"type": "function", "function": {"name": tool["name"]}}}
+    return _TOOL_CHOICE_AUTO
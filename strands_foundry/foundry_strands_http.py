@@ -28,8 +28,7 @@ def setup_logging() -> logging.Logger:
 
 def extract_text(message: dict) -> str:
     blocks = message.get("content", [])
-    parts = [block.get("text", "") for block in blocks if "text" in block]
-    return "\n".join([p for p in parts if p])
+    return "\n".join(t for block in blocks if isinstance(t := block.get("text"), str) and t)
 
 
 def main() -> None:
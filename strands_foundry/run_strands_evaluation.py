@@ -1,14 +1,28 @@
 import argparse
+import asyncio
+import atexit
+import functools
+import hashlib
 import json
 import os
+import queue
 import re
 import sys
+import tempfile
 import logging
+import logging.handlers
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
+import httpx
+import openai
 from dotenv import load_dotenv
 from strands import Agent
+from strands.agent import AgentResult
+from strands.types.exceptions import ModelThrottledException
 from strands_tools import http_request
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -21,123 +35,406 @@ from evaluation_utils import (
     classify_provenance,
     build_canonical_snapshot,
     extract_data_hints_strands,
+    BackgroundWriter,
+    encode_json,
+    write_json_if_changed,
+    append_run_manifest_event,
+    finalize_manifest,
+    ensure_dir,
 )
 
 logger = logging.getLogger(__name__)
 
+_SANITIZE_RE = re.compile(r"[^-\w.]")
 
-def setup_logging(log_dir: str) -> logging.Logger:
-    os.makedirs(log_dir, exist_ok=True)
-    log_path = os.path.join(log_dir, "strands_evaluation.log")
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-        handlers=[logging.FileHandler(log_path), logging.StreamHandler()],
-    )
-    return logging.getLogger(__name__)
 
+class JsonLinesFormatter(logging.Formatter):
+    """Formats each record as one JSON object so interleaved concurrent runs stay parseable."""
 
-def update_run_manifest(
-    run_dir: str,
-    framework: str,
-    models: list[str],
-    prompt_file: str,
-    prompt_version: str,
-    started_at_utc: str,
-    started_at_human: str,
-) -> None:
-    manifest_path = os.path.join(run_dir, "manifest.json")
-    manifest: dict = {}
-    if os.path.exists(manifest_path):
-        with open(manifest_path, "r") as f:
-            manifest = json.load(f)
-
-    if not manifest:
-        manifest = {
-            "run_group": os.path.basename(run_dir),
-            "framework_runs": {},
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
         }
+        # Any traceback is already folded into msg: QueueHandler.prepare formats the
+        # record before it reaches this handler.
+        return json.dumps(entry)
 
-    manifest["framework_runs"][framework] = {
-        "started_at_utc": started_at_utc,
-        "started_at_human": started_at_human,
-        "models": models,
-        "prompt_file": prompt_file,
-        "prompt_version": prompt_version,
-    }
 
-    with open(manifest_path, "w") as f:
-        json.dump(manifest, f, indent=2)
+def setup_logging(log_dir: str, parallel: bool = False) -> logging.Logger:
+    ensure_dir(log_dir)
+    log_path = os.path.join(log_dir, "strands_evaluation.log")
+
+    file_handler = logging.FileHandler(log_path)
+    file_handler.setFormatter(JsonLinesFormatter())
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    if parallel:
+        # Interleaved per-prompt progress from concurrent runs is unreadable on a
+        # console; keep the full record in the log file and surface only problems.
+        stream_handler.setLevel(logging.WARNING)
+
+    # Callers only enqueue records; one listener thread does all file/console IO.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    return logging.getLogger(__name__)
 
 
 def sanitize_filename(text: str) -> str:
-    s = str(text).strip().replace(" ", "_")
-    s = re.sub(r"(?u)[^-\w.]", "", s)
-    return s
+    if not isinstance(text, str):
+        text = str(text)
+    return _SANITIZE_RE.sub("", text.strip().replace(" ", "_"))
 
 
 def extract_text(message: dict) -> tuple[str, str]:
     blocks = message.get("content", [])
-    parts = [block.get("text", "") for block in blocks if "text" in block]
-    text = "\n".join([p for p in parts if p]).strip()
+    text = "\n".join(t for block in blocks if isinstance(t := block.get("text"), str) and t).strip()
     if text:
         return text, "text"
 
     # Some models return final answer only in reasoningContent; use it as a fallback
     # to avoid false negatives in downstream validation.
-    reasoning_parts: list[str] = []
-    for block in blocks:
-        reasoning = block.get("reasoningContent", {})
-        reasoning_text = reasoning.get("reasoningText", {})
-        candidate = reasoning_text.get("text")
-        if isinstance(candidate, str) and candidate.strip():
-            reasoning_parts.append(candidate.strip())
-
-    fallback_text = "\n".join(reasoning_parts).strip()
+    fallback_text = "\n".join(
+        t
+        for block in blocks
+        if isinstance(t := block.get("reasoningContent", {}).get("reasoningText", {}).get("text"), str)
+        and (t := t.strip())
+    ).strip()
     if fallback_text:
         return fallback_text, "reasoning_fallback"
     return "", "empty"
 
 
-def create_agent(model_name: str) -> Agent:
-    model = FoundryCompletionsModel(
-        model_id=model_name,
+# Foundry's OpenAI-compatible endpoints cache request prefixes automatically; there is
+# no explicit cache marker to send (the provider drops cachePoint blocks). Hits depend
+# on every request starting with byte-identical tools + system prompt, so both stay
+# fixed for the whole run and the per-prompt user text always comes after them.
+SYSTEM_PROMPT = (
+    "You are a helpful assistant. Use tools when needed. "
+    "Respond with the final answer only. Do not include analysis or scratch work."
+)
+TOOLS = (http_request,)
+TEMPERATURE = 0.2
+# Failures worth retrying the whole prompt for: throttling that outlasted Strands' own
+# retries, dropped connections/timeouts, and 5xx responses.
+TRANSIENT_MODEL_ERRORS = (ModelThrottledException, openai.APIConnectionError, openai.InternalServerError)
+# Threads that validate and encode finished prompts while other prompts wait on the model.
+RESULT_CONSUMERS = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_http_client() -> httpx.AsyncClient:
+    # Every deployment lives on the same Foundry endpoint, so one keep-alive pool lets
+    # models reuse each other's TLS connections instead of each opening their own.
+    return openai.DefaultAsyncHttpxClient(
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_model(model_id: str, temperature: float) -> FoundryCompletionsModel:
+    # Agents for the same deployment share one provider and therefore one HTTP client.
+    return FoundryCompletionsModel(
+        model_id=model_id,
         endpoint=os.getenv("FOUNDRY_ENDPOINT", ""),
         api_key=os.getenv("FOUNDRY_API_KEY", ""),
-        params={"temperature": 0.2},
+        params={"temperature": temperature},
+        http_client=_shared_http_client(),
+    )
+
+
+async def _close_http_clients() -> None:
+    # The pool is bound to this run's event loop; drop it (and the providers using it)
+    # so a later run in the same process starts fresh.
+    if _shared_http_client.cache_info().currsize:
+        await _shared_http_client().aclose()
+    _shared_http_client.cache_clear()
+    _get_model.cache_clear()
+
+
+def create_agent(model_name: str) -> Agent:
+    # No callback handler: the default one streams every answer to stdout, interleaving
+    # concurrent runs; answers are saved to the result files instead.
+    return Agent(
+        model=_get_model(model_name, TEMPERATURE),
+        tools=list(TOOLS),
+        system_prompt=SYSTEM_PROMPT,
+        callback_handler=None,
+    )
+
+
+class ResponseCache:
+    """Stores agent transcripts as ``{key}.json`` files so reruns can skip the model call.
+
+    Cached answers for live-data prompts go stale, so the cache is opt-in (``--use-cache``)
+    and every payload records whether it was served from here.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir = cache_dir
+        ensure_dir(cache_dir)
+
+    @staticmethod
+    def key_for(model_name: str, prompt_text: str, prompt_version: str) -> str:
+        material = json.dumps(
+            {
+                "model": model_name,
+                "system_prompt": SYSTEM_PROMPT,
+                "prompt_text": prompt_text,
+                "temperature": TEMPERATURE,
+                "prompt_version": prompt_version,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        try:
+            with open(os.path.join(self.cache_dir, f"{key}.json"), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Ignoring unreadable cache entry %s", key)
+            return None
+
+    def set(self, key: str, value: dict) -> None:
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        # A unique temp name keeps concurrent writers of the same key apart; a failed dump
+        # must not leave it behind.
+        f = tempfile.NamedTemporaryFile("w", dir=self.cache_dir, suffix=".tmp", delete=False)
+        try:
+            with f:
+                json.dump(value, f)
+            os.replace(f.name, path)
+        except BaseException:
+            os.unlink(f.name)
+            raise
+
+
+class AgentPool:
+    """Hands out idle agents per model so prompts reuse agents instead of rebuilding them.
+
+    Agents are stateful and reject concurrent invocations, so an agent is only ever
+    checked out by one prompt at a time and its conversation is reset when returned.
+    All calls happen on the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        self._idle: dict[str, list[Agent]] = defaultdict(list)
+
+    def acquire(self, model_name: str) -> Agent:
+        idle = self._idle[model_name]
+        return idle.pop() if idle else create_agent(model_name)
+
+    def release(self, model_name: str, agent: Agent) -> None:
+        # Rebind rather than clear(): the finished transcript still references the old list.
+        agent.messages = []
+        # Let go of the finished conversation's serialized tool payloads too.
+        agent.model.clear_format_cache()
+        self._idle[model_name].append(agent)
+
+
+@dataclass(frozen=True)
+class RunContext:
+    run_id: str
+    run_meta: dict
+    prompt_version: str
+    canonical_snapshot: dict
+    model_results_dirs: dict[str, str]
+    sidecar_bases: dict[str, dict]
+    agents: AgentPool
+    result_pool: ThreadPoolExecutor
+    writer: BackgroundWriter
+    cache: ResponseCache | None = None
+
+
+def _is_transient(exc: BaseException | None) -> bool:
+    # Strands wraps most model errors in EventLoopException; look through the cause chain.
+    while exc is not None:
+        if isinstance(exc, TRANSIENT_MODEL_ERRORS):
+            return True
+        exc = exc.__cause__
+    return False
+
+
+async def _invoke(
+    agent: Agent,
+    prompt_text: str,
+    retries: int = 4,
+    backoff_s: float = 2.0,
+    max_backoff_s: float = 30.0,
+) -> AgentResult:
+    for attempt in range(retries):
+        try:
+            return await agent.invoke_async(prompt_text)
+        except Exception as e:
+            if not _is_transient(e):
+                raise
+            delay = min(max_backoff_s, backoff_s * 2**attempt)
+            logger.warning(
+                "    Transient model error (%s); retrying in %.0fs (%d/%d)", e, delay, attempt + 1, retries
+            )
+            # Start the retry from a clean conversation, not the failed partial one.
+            agent.messages = []
+            await asyncio.sleep(delay)
+    return await agent.invoke_async(prompt_text)
+
+
+async def _run_one_async(model_name: str, prompt_obj: dict, ctx: RunContext, sem: asyncio.Semaphore) -> None:
+    # Log each outcome as it lands so progress is visible while the rest are still in flight.
+    try:
+        paths = await _evaluate_prompt_async(model_name, prompt_obj, ctx, sem)
+    except Exception as e:
+        logger.exception("    Error evaluating prompt '%s' for model %s: %s", prompt_obj["text"], model_name, e)
+        return
+    logger.info("    [%s] Results queued for %s", model_name, paths["log_path"])
+    logger.info("    [%s] Validation queued for %s", model_name, paths["validation_path"])
+
+
+async def _evaluate_prompt_async(model_name: str, prompt_obj: dict, ctx: RunContext, sem: asyncio.Semaphore) -> dict:
+    prompt_text = prompt_obj["text"]
+    cache_key = ctx.cache.key_for(model_name, prompt_text, ctx.prompt_version) if ctx.cache else None
+    cached = await asyncio.to_thread(ctx.cache.get, cache_key) if ctx.cache else None
+
+    if cached is not None:
+        logger.info("  - Cache hit for %s: '%s'", model_name, prompt_text)
+        transcript = cached
+    else:
+        async with sem:
+            logger.info("  - Running prompt for %s: '%s'", model_name, prompt_text)
+            agent = ctx.agents.acquire(model_name)
+            try:
+                result = await _invoke(agent, prompt_text)
+                transcript = {
+                    "stop_reason": result.stop_reason,
+                    "message": result.message,
+                    "messages": agent.messages,
+                }
+            finally:
+                ctx.agents.release(model_name, agent)
+        if ctx.cache:
+            # A failed cache write only costs a future rerun; the answer itself is still saved.
+            try:
+                await asyncio.to_thread(ctx.cache.set, cache_key, transcript)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("    Could not cache response for %s: %s", model_name, e)
+
+    # ISS validation interpolates against this time, so take it at answer time rather
+    # than whenever the result pool gets to this prompt.
+    eval_time_unix = int(time.time())
+
+    # Validation and encoding are blocking; hand them to the result pool so the event loop
+    # moves straight on to other prompts' model calls.
+    return await asyncio.get_running_loop().run_in_executor(
+        ctx.result_pool,
+        functools.partial(
+            _save_results, model_name, prompt_obj, ctx, transcript, eval_time_unix, cache_hit=cached is not None
+        ),
     )
 
-    system_prompt = (
-        "You are a helpful assistant. Use tools when needed. "
-        "Respond with the final answer only. Do not include analysis or scratch work."
+
+def _save_results(
+    model_name: str,
+    prompt_obj: dict,
+    ctx: RunContext,
+    transcript: dict,
+    eval_time_unix: int,
+    cache_hit: bool,
+) -> dict:
+    prompt_name = prompt_obj["name"]
+    prompt_text = prompt_obj["text"]
+    messages = transcript["messages"]
+    prefix = os.path.join(ctx.model_results_dirs[model_name], f"{prompt_name}_{ctx.run_id}")
+
+    log_path = prefix + ".json"
+    final_text, final_text_source = extract_text(transcript["message"])
+    payload = {
+        "run": ctx.run_meta,
+        "model": model_name,
+        "prompt_name": prompt_name,
+        "prompt_version": ctx.prompt_version,
+        "prompt_text": prompt_text,
+        "stop_reason": transcript["stop_reason"],
+        "final_message": transcript["message"],
+        "final_text": final_text,
+        "final_text_source": final_text_source,
+        "cache_hit": cache_hit,
+        "messages": messages,
+    }
+
+    ctx.writer.put(log_path, encode_json(payload))
+
+    # Validation + provenance (sidecar)
+    tool_used, tool_names = detect_tool_use_strands(messages)
+    validation = validate_result(
+        prompt_obj,
+        payload["final_text"],
+        ctx.canonical_snapshot,
+        eval_time_unix=eval_time_unix,
     )
+    provenance = classify_provenance(tool_used, validation)
+    data_hints = extract_data_hints_strands(messages)
+
+    canonical = ctx.canonical_snapshot["prompts"].get(prompt_name, {})
+    validation_path = prefix + "_validation.json"
+    sidecar = ctx.sidecar_bases[model_name] | {
+        "prompt_name": prompt_name,
+        "canonical": canonical,
+        "messages_file": os.path.basename(log_path),
+        "tool_used": tool_used,
+        "tool_names": tool_names,
+        "provenance": provenance,
+        "eval_time_unix": eval_time_unix,
+        "data_hints": data_hints,
+        "validation": validation,
+    }
+    ctx.writer.put(validation_path, encode_json(sidecar))
 
-    return Agent(model=model, tools=[http_request], system_prompt=system_prompt)
+    return {"model": model_name, "prompt_name": prompt_name, "log_path": log_path, "validation_path": validation_path}
 
 
-def run_evaluation(models: list[str], prompt_file: str, run_group: str | None) -> None:
+async def run_evaluation_async(
+    models: list[str],
+    prompt_file: str,
+    run_group: str | None,
+    max_workers: int = 8,
+    use_cache: bool = False,
+) -> None:
+    # One instant for every run timestamp so the local and UTC strings agree.
+    started_utc = datetime.now(timezone.utc)
+    started_local = started_utc.astimezone()
+
     repo_root = os.path.dirname(os.path.dirname(__file__))
-    run_group_id = run_group or datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_group_id = run_group or started_local.strftime("%Y%m%d_%H%M%S")
     run_dir = os.path.join(repo_root, "evaluation_results", "runs", run_group_id)
-    os.makedirs(run_dir, exist_ok=True)
+    ensure_dir(run_dir)
 
-    started_dt = datetime.now().astimezone()
-    run_started_human = started_dt.strftime("%Y-%m-%d %H:%M:%S %Z")
-    run_started_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    run_started_human = started_local.strftime("%Y-%m-%d %H:%M:%S %Z")
+    run_started_utc = started_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
 
     prompt_data = load_prompts(prompt_file)
     prompts = prompt_data["prompts"]
     prompt_version = prompt_data.get("version", "unknown")
 
-    update_run_manifest(
-        run_dir=run_dir,
-        framework="strands",
-        models=models,
-        prompt_file=prompt_file,
-        prompt_version=prompt_version,
-        started_at_utc=run_started_utc,
-        started_at_human=run_started_human,
+    append_run_manifest_event(
+        run_dir,
+        {
+            "framework": "strands",
+            "started_at_utc": run_started_utc,
+            "started_at_human": run_started_human,
+            "models": models,
+            "prompt_file": prompt_file,
+            "prompt_version": prompt_version,
+        },
     )
 
     logger.info("Run group: %s", run_group_id)
@@ -145,104 +442,75 @@ def run_evaluation(models: list[str], prompt_file: str, run_group: str | None) -
 
     canonical_snapshot = build_canonical_snapshot(prompt_data)
     canonical_dir = os.path.join(run_dir, "canonical")
-    os.makedirs(canonical_dir, exist_ok=True)
+    ensure_dir(canonical_dir)
     canonical_path = os.path.join(canonical_dir, f"canonical_{prompt_version}.json")
-    with open(canonical_path, "w") as f:
-        json.dump(canonical_snapshot, f, indent=2)
-    logger.info("Canonical snapshot saved to %s", canonical_path)
+    if write_json_if_changed(canonical_path, canonical_snapshot):
+        logger.info("Canonical snapshot saved to %s", canonical_path)
+    else:
+        logger.info("Canonical snapshot unchanged at %s", canonical_path)
 
     results_root = os.path.join(run_dir, "strands")
-    if not os.path.exists(results_root):
-        os.makedirs(results_root)
-
-    run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-
+    ensure_dir(results_root)
+    model_results_dirs = {}
     for model_name in models:
-        sanitized_model_name = sanitize_filename(model_name)
-        model_results_dir = os.path.join(results_root, sanitized_model_name)
-        if not os.path.exists(model_results_dir):
-            os.makedirs(model_results_dir)
-
-        logger.info("--- Running Strands evaluation for model: %s ---", model_name)
-        for prompt_obj in prompts:
-            prompt_name = prompt_obj["name"]
-            prompt_text = prompt_obj["text"]
-            
-            logger.info("  - Running prompt: '%s'", prompt_text)
-            try:
-                agent = create_agent(model_name)
-                result = agent(prompt_text)
-
-                log_path = os.path.join(model_results_dir, f"{prompt_name}_{run_id}.json")
-                final_text, final_text_source = extract_text(result.message)
-                payload = {
-                    "run": {
-                        "run_group": run_group_id,
-                        "framework": "strands",
-                        "started_at_human": run_started_human,
-                        "started_at_utc": run_started_utc,
-                    },
-                    "model": model_name,
-                    "prompt_name": prompt_name,
-                    "prompt_version": prompt_version,
-                    "prompt_text": prompt_text,
-                    "stop_reason": result.stop_reason,
-                    "final_message": result.message,
-                    "final_text": final_text,
-                    "final_text_source": final_text_source,
-                    "messages": agent.messages,
-                }
+        model_results_dirs[model_name] = os.path.join(results_root, sanitize_filename(model_name))
+        ensure_dir(model_results_dirs[model_name])
+
+    run_meta = {
+        "run_group": run_group_id,
+        "framework": "strands",
+        "started_at_human": run_started_human,
+        "started_at_utc": run_started_utc,
+    }
+    ctx = RunContext(
+        run_id=started_local.strftime("%Y%m%d_%H%M%S"),
+        run_meta=run_meta,
+        prompt_version=prompt_version,
+        canonical_snapshot=canonical_snapshot,
+        model_results_dirs=model_results_dirs,
+        # Sidecar fields that only vary per model; each prompt merges its own on top.
+        sidecar_bases={
+            model_name: {"run": run_meta, "model": model_name, "prompt_version": prompt_version}
+            for model_name in models
+        },
+        agents=AgentPool(),
+        # A dedicated pool keeps result processing from competing with Strands' own
+        # tool threads, which run on the loop's default executor.
+        result_pool=ThreadPoolExecutor(max_workers=RESULT_CONSUMERS, thread_name_prefix="strands-results"),
+        writer=BackgroundWriter(),
+        cache=ResponseCache(os.path.join(repo_root, "evaluation_results", "cache", "strands")) if use_cache else None,
+    )
 
-                with open(log_path, "w") as f:
-                    json.dump(payload, f, indent=2)
-
-                # Validation + provenance (sidecar)
-                tool_used, tool_names = detect_tool_use_strands(agent.messages)
-                eval_time_unix = int(time.time())
-                validation = validate_result(
-                    prompt_obj,
-                    payload["final_text"],
-                    canonical_snapshot,
-                    eval_time_unix=eval_time_unix,
-                )
-                provenance = classify_provenance(tool_used, validation)
-                data_hints = extract_data_hints_strands(agent.messages)
-
-                validation_path = os.path.join(model_results_dir, f"{prompt_name}_{run_id}_validation.json")
-                with open(validation_path, "w") as f:
-                    json.dump(
-                        {
-                            "run": {
-                                "run_group": run_group_id,
-                                "framework": "strands",
-                                "started_at_human": run_started_human,
-                                "started_at_utc": run_started_utc,
-                            },
-                            "model": model_name,
-                            "prompt_name": prompt_name,
-                            "prompt_version": prompt_version,
-                            "canonical": canonical_snapshot["prompts"].get(prompt_name, {}),
-                            "tool_used": tool_used,
-                            "tool_names": tool_names,
-                            "provenance": provenance,
-                            "eval_time_unix": eval_time_unix,
-                            "data_hints": data_hints,
-                            "validation": validation,
-                        },
-                        f,
-                        indent=2,
-                    )
-
-                logger.info("    Results saved to %s", log_path)
-                logger.info("    Validation saved to %s", validation_path)
-
-            except Exception as e:
-                logger.exception(
-                    "    Error evaluating prompt '%s' for model %s: %s",
-                    prompt_text,
-                    model_name,
-                    e,
-                )
+    # Each (model, prompt) pair is an independent, I/O-bound agent run, so they
+    # all share one event loop; the semaphore caps in-flight Foundry requests.
+    sem = asyncio.Semaphore(max_workers)
+    logger.info("--- Running Strands evaluation for models: %s ---", ", ".join(models))
+    try:
+        await asyncio.gather(
+            *(_run_one_async(model_name, prompt_obj, ctx, sem) for model_name in models for prompt_obj in prompts)
+        )
+    finally:
+        await _close_http_clients()
+        ctx.result_pool.shutdown()
+        ctx.writer.close()
+        finalize_manifest(run_dir)
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def run_evaluation(
+    models: list[str],
+    prompt_file: str,
+    run_group: str | None,
+    max_workers: int = 8,
+    use_cache: bool = False,
+) -> None:
+    asyncio.run(run_evaluation_async(models, prompt_file, run_group, max_workers=max_workers, use_cache=use_cache))
 
 
 if __name__ == "__main__":
@@ -260,11 +528,17 @@ if __name__ == "__main__":
     )
     parser.add_argument("--prompts", type=str, default="prompts.json", help="Path to prompts JSON file.")
     parser.add_argument("--run-group", type=str, default=None, help="Run group id. Use same value across scratch/strands to group one cohort.")
+    parser.add_argument("--max-workers", type=positive_int, default=8, help="Maximum number of (model, prompt) runs in flight at once.")
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help="Reuse transcripts from evaluation_results/cache/ for identical (model, prompt) requests instead of calling the model.",
+    )
     args = parser.parse_args()
 
     repo_root = os.path.dirname(os.path.dirname(__file__))
     run_group_id = args.run_group or datetime.now().strftime("%Y%m%d_%H%M%S")
     log_dir = os.path.join(repo_root, "evaluation_results", "runs", run_group_id, "logs")
-    logger = setup_logging(log_dir)
+    logger = setup_logging(log_dir, parallel=args.max_workers > 1)
 
-    run_evaluation(args.models, args.prompts, run_group_id)
+    run_evaluation(args.models, args.prompts, run_group_id, max_workers=args.max_workers, use_cache=args.use_cache)